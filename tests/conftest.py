@@ -0,0 +1,12 @@
+import os
+import sys
+import tempfile
+
+# config.py refuses to import without credentials
+os.environ.setdefault("TELEGRAM_TOKEN", "test-token")
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+os.environ.pop("REDIS_URL", None)
+# Keep the knowledge base cache and index out of the working tree
+os.environ["KB_CACHE_FILE"] = os.path.join(tempfile.mkdtemp(), "kb_cache.txt.gz")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,47 @@
+import re
+
+import pytest
+
+from ugmsa_bot.formatting import format_response
+
+
+def legacy_format_response(text):
+    """The original eight-pass formatter, kept as a reference"""
+    if not text:
+        return text
+    text = re.sub(r'^###\s+(.+?)$', r'<b>📌 \1</b>', text, flags=re.MULTILINE)
+    text = re.sub(r'^##\s+(.+?)$', r'<b>▶️ \1</b>', text, flags=re.MULTILINE)
+    text = re.sub(r'^#\s+(.+?)$', r'<b>🔹 \1</b>', text, flags=re.MULTILINE)
+    text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
+    text = re.sub(r'\*(.+?)\*', r'<i>\1</i>', text)
+    text = re.sub(r'_(.+?)_', r'<u>\1</u>', text)
+    text = re.sub(r'`([^`]+)`', r'<code>\1</code>', text)
+    text = re.sub(r'^\s*[-•]\s+', r'  ✓ ', text, flags=re.MULTILINE)
+    return text.replace('*', '')
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    None,
+    "Plain text with no markdown.",
+    "### Events\nHere are **key dates**:\n- `12 May` General meeting\n- *Note*: bring ID",
+    "## Leadership\n# Top\n• President: _John_",
+    "**UGMSA** is great 🎓\n\n1. One\n2. Two\n* starred *item*",
+    "### **Bold header**\nText `code` and **bold *nested* text**",
+    "*Note: **important** thing*",
+    "*a **b***",
+    "_**underlined bold**_ and **_bold underlined_**",
+    "# # not a nested header\n- - not a nested bullet",
+    "**- dash inside bold** and *# hash inside italic*",
+    "#### four\n### three\n## two\n# one\n#nospace",
+    "a\n\n- x\n  - y",
+    "snake_case_name and more_text",
+    "a * b and ** c\n5 * 3 = 15\n*unclosed",
+])
+def test_matches_legacy_formatter(text):
+    assert format_response(text) == legacy_format_response(text)
+
+
+def test_code_spans_are_verbatim():
+    # Unlike the legacy formatter, markup characters inside `code` are kept
+    assert format_response("`snake_case_name` and `a*b`") == "<code>snake_case_name</code> and <code>a*b</code>"
@@ -0,0 +1,30 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from telegram import Chat, Message
+
+from ugmsa_bot import handlers
+from ugmsa_bot.messages import BUTTON_REPLIES
+
+
+@pytest.mark.parametrize("data", list(BUTTON_REPLIES))
+def test_repeated_button_tap_skips_edit(data):
+    text, plain, keyboard = BUTTON_REPLIES[data]
+    # What Telegram sends back for a message we already edited to this reply
+    message = Message(1, datetime.now(), Chat(1, Chat.PRIVATE), text=plain, reply_markup=keyboard)
+    edits = []
+
+    async def answer():
+        pass
+
+    async def edit_message_text(*args, **kwargs):
+        edits.append(args)
+
+    query = SimpleNamespace(
+        data=data, from_user=SimpleNamespace(id=1), message=message,
+        answer=answer, edit_message_text=edit_message_text,
+    )
+    asyncio.run(handlers.button_callback(SimpleNamespace(callback_query=query), None))
+    assert edits == []
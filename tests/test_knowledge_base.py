@@ -0,0 +1,125 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from aiohttp import web, ClientSession
+
+from ugmsa_bot import knowledge_base
+
+DOC = "UGMSA constitution — Article 1\n" * 100
+
+
+def serve_doc(content_type):
+    """Run fetch_google_doc twice against a local server exporting DOC"""
+    async def export(request):
+        return web.Response(body=DOC.encode(), headers={"Content-Type": content_type})
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/document/d/{doc_id}/export", export)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+
+        async with ClientSession() as session:
+            class LocalSession:
+                def get(self, url, **kwargs):
+                    return session.get(url.replace("https://docs.google.com", f"http://127.0.0.1:{port}"), **kwargs)
+
+            validators = {}
+            first = await knowledge_base.fetch_google_doc(LocalSession(), "doc", validators)
+            second = await knowledge_base.fetch_google_doc(LocalSession(), "doc", validators)
+        await runner.cleanup()
+        return first, second, validators
+
+    return asyncio.run(run())
+
+
+def test_fetch_google_doc_with_charset():
+    first, second, _ = serve_doc("text/plain; charset=utf-8")
+    assert first == DOC
+    assert second == DOC
+
+
+def test_fetch_google_doc_without_charset():
+    first, second, validators = serve_doc("text/plain")
+    assert first == DOC
+    assert second == DOC
+    assert all(entry["sha256"] for entry in validators.values())
+
+
+TOPICS = ["congress", "dues", "elections", "library", "sports", "health", "exams", "clinic"]
+
+
+def make_knowledge(suffix=""):
+    """A knowledge base with one chunk per topic, big enough to need an index"""
+    return "\n".join(f"{topic} " * 300 + f"about {topic}{suffix}" for topic in TOPICS)
+
+
+def embed(text):
+    return [float(text.count(topic)) + 0.01 for topic in TOPICS]
+
+
+class FakeEmbeddings:
+    """Stand-in for client.embeddings that can fail or pause on demand"""
+    def __init__(self):
+        self.fail = False
+        self.paused = None
+        self.calls = 0
+
+    async def create(self, model, input):
+        self.calls += 1
+        if self.paused:
+            await self.paused.wait()
+        if self.fail:
+            raise RuntimeError("embeddings unavailable")
+        return SimpleNamespace(data=[SimpleNamespace(embedding=embed(text)) for text in input])
+
+
+@pytest.fixture
+def embeddings(monkeypatch):
+    fake = FakeEmbeddings()
+    monkeypatch.setattr(knowledge_base.client, "embeddings", fake)
+    monkeypatch.setattr(knowledge_base, "knowledge_base_cache", None)
+    monkeypatch.setattr(knowledge_base, "knowledge_chunks", [])
+    monkeypatch.setattr(knowledge_base, "knowledge_embeddings", None)
+    monkeypatch.setattr(knowledge_base, "read_knowledge_index", lambda digest: None)
+    monkeypatch.setattr(knowledge_base, "write_knowledge_index", lambda digest, chunks, matrix: None)
+    return fake
+
+
+def test_failed_index_build_is_retried(embeddings):
+    knowledge = make_knowledge()
+
+    async def run():
+        embeddings.fail = True
+        await knowledge_base.set_knowledge_base(knowledge)
+        assert knowledge_base.knowledge_index_missing()
+
+        embeddings.fail = False
+        await knowledge_base.set_knowledge_base(knowledge)
+        assert not knowledge_base.knowledge_index_missing()
+        return await knowledge_base.retrieve_knowledge("dues")
+
+    assert "about dues" in asyncio.run(run())
+
+
+def test_retrieval_survives_concurrent_rebuild(embeddings):
+    async def run():
+        await knowledge_base.set_knowledge_base(make_knowledge())
+
+        # The question's embedding is in flight while a refresh rebuilds the index
+        embeddings.paused = asyncio.Event()
+        calls = embeddings.calls
+        question = asyncio.create_task(knowledge_base.retrieve_knowledge("dues"))
+        rebuild = asyncio.create_task(knowledge_base.set_knowledge_base(make_knowledge(" (updated)")))
+        while embeddings.calls < calls + 2:
+            await asyncio.sleep(0.01)
+        embeddings.paused.set()
+        return await question, await rebuild
+
+    answer, _ = asyncio.run(run())
+    assert "about dues" in answer
+    assert "(updated)" not in answer
@@ -0,0 +1 @@
+"""UGMSA AI Assistant Telegram bot"""
@@ -0,0 +1,59 @@
+"""Environment configuration and logging setup"""
+import os
+import sys
+import logging
+from pathlib import Path
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# === LOGGING CONFIGURATION ===
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler(sys.stdout)
+    ]
+)
+logger = logging.getLogger(__name__)
+
+# === CONFIGURATION ===
+TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+PORT = int(os.getenv("PORT", "8080"))  # For health check endpoint
+REDIS_URL = os.getenv("REDIS_URL")  # Optional, shares chat history across restarts/replicas
+
+# Document IDs from Google Drive
+UGMSA_DOC_IDS = ["1vyX3bAFBgX8QuaCCsNHdyltyLMZCzB6BtnELtmjlcd0"]
+
+# Duplicates and unfilled placeholders removed once, so loads fetch a clean list
+VALID_DOC_IDS = list(dict.fromkeys(
+    doc_id for doc_id in UGMSA_DOC_IDS if doc_id and not doc_id.startswith("YOUR_DOCUMENT_ID")
+))
+
+# UGMSA Website URL
+UGMSA_WEBSITE_URL = "https://ugmsa.org/"
+
+# Main bot link
+MAIN_BOT_LINK = "https://t.me/UGMSA_bot"
+
+# On-disk knowledge base cache (reused across restarts until it goes stale)
+KB_CACHE_FILE = Path(os.getenv("KB_CACHE_FILE", "kb_cache.txt.gz"))  # Gzip-compressed
+KB_VALIDATORS_FILE = KB_CACHE_FILE.with_suffix(".etags.json.gz")  # Holds each source's text too
+KB_CACHE_TTL = int(os.getenv("KB_CACHE_TTL", str(6 * 60 * 60)))  # Seconds
+KB_RETRY_INTERVAL = 5 * 60  # Seconds between retries while no knowledge base is loaded
+KB_INDEX_FILE = KB_CACHE_FILE.with_suffix(".npz")
+
+# Knowledge retrieval: only the most relevant chunks are sent with each question
+EMBEDDING_MODEL = "text-embedding-3-small"
+KB_CHUNK_CHARS = 2000  # Roughly 500 tokens
+KB_TOP_K = 5
+
+# Number of messages remembered per user
+HISTORY_LIMIT = 10
+# In-memory history keeps only the most recently active users
+MAX_CONVERSATIONS = 10_000
+
+if not TELEGRAM_TOKEN or not OPENAI_API_KEY:
+    logger.error("Missing required environment variables: TELEGRAM_TOKEN and/or OPENAI_API_KEY")
+    raise ValueError("Missing environment variables: TELEGRAM_TOKEN and/or OPENAI_API_KEY")
@@ -0,0 +1,62 @@
+"""Markdown to Telegram HTML conversion"""
+import re
+
+# === TEXT FORMATTING ===
+# Every markdown rule in one alternation so a reply is scanned only once
+INLINE_RULES = (
+    r'(?P<bold>\*\*(.+?)\*\*)'
+    r'|(?P<italic>\*(?!\*)((?:\*\*.+?\*\*|[^*\n])+)\*)'  # May contain **bold** runs
+    r'|(?P<underline>_(.+?)_)'
+    r'|(?P<code>`([^`]+)`)'
+    r'|(?P<stray>\*)'  # Unpaired asterisks are dropped
+)
+FORMAT_PATTERN = re.compile(
+    r'(?P<header>^(#{1,3})\s+(.+?)$)'
+    r'|(?P<bullet>^\s*[-•]\s+)'
+    r'|' + INLINE_RULES,
+    re.MULTILINE
+)
+# Text inside a header or inline span only gets inline markup
+INLINE_PATTERN = re.compile(INLINE_RULES)
+
+# Header templates keyed by the number of leading '#'
+HEADER_TEMPLATES = {
+    1: '<b>🔹 {}</b>',
+    2: '<b>▶️ {}</b>',
+    3: '<b>📌 {}</b>',
+}
+
+FORMAT_TEMPLATES = {
+    'bold': '<b>{}</b>',
+    'italic': '<i>{}</i>',
+    'underline': '<u>{}</u>',
+    'code': '<code>{}</code>',
+}
+
+def _format_match(match):
+    """Render a single FORMAT_PATTERN or INLINE_PATTERN match as Telegram HTML"""
+    kind = match.lastgroup
+    if kind == 'bullet':
+        return '  ✓ '
+    if kind == 'stray':
+        return ''
+
+    # The inner text sits in the unnamed group(s) right after the named one
+    if kind == 'header':
+        hashes, inner = match.group(match.lastindex + 1, match.lastindex + 2)
+        template = HEADER_TEMPLATES[len(hashes)]
+    else:
+        inner = match.group(match.lastindex + 1)
+        template = FORMAT_TEMPLATES[kind]
+
+    if kind != 'code':
+        inner = INLINE_PATTERN.sub(_format_match, inner)
+    return template.format(inner)
+
+def format_response(text):
+    """Convert markdown to Telegram HTML with enhanced styling"""
+    if not text:
+        return text
+    
+    # Headers, inline markdown, bullet points and stray asterisks in a single pass
+    return FORMAT_PATTERN.sub(_format_match, text)
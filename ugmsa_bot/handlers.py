@@ -0,0 +1,143 @@
+"""Telegram command, button and chat handlers"""
+import logging
+from telegram import Update, Message
+from telegram.ext import ContextTypes
+from telegram.constants import ParseMode
+from telegram.error import BadRequest
+
+from . import knowledge_base
+from .formatting import format_response
+from .history import get_history, add_to_history, clear_history
+from .http_client import client
+from .keyboards import MAIN_MENU_KEYBOARD, BACK_KEYBOARD
+from .knowledge_base import BASE_SYSTEM_PROMPT, build_system_prompt, retrieve_knowledge
+from .messages import WELCOME_TEXT, MENU_TEXT, ERROR_TEXT, BUTTON_REPLIES
+
+logger = logging.getLogger(__name__)
+
+# === MESSAGE HELPERS ===
+async def send_html_message(update, html, keyboard=None):
+    """Send already formatted HTML via callback or regular message"""
+    if update.callback_query and update.callback_query.message:
+        await update.callback_query.message.reply_text(
+            html, parse_mode=ParseMode.HTML, reply_markup=keyboard
+        )
+    elif update.message:
+        await update.message.reply_text(
+            html, parse_mode=ParseMode.HTML, reply_markup=keyboard
+        )
+
+async def send_formatted_message(update, context, text, keyboard=None):
+    """Send formatted message via callback or regular message"""
+    await send_html_message(update, format_response(text), keyboard)
+
+# === COMMAND HANDLERS ===
+async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /start command"""
+    await send_html_message(update, WELCOME_TEXT, MAIN_MENU_KEYBOARD)
+
+async def menu(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /menu command"""
+    await send_html_message(update, MENU_TEXT, MAIN_MENU_KEYBOARD)
+
+# === BUTTON HANDLERS ===
+async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle inline button presses"""
+    query = update.callback_query
+    if not query or not query.from_user:
+        return
+    
+    await query.answer()
+    user_id = query.from_user.id
+    
+    if query.data == "clear_history":
+        await clear_history(user_id)
+    
+    if query.data in BUTTON_REPLIES:
+        text, plain, keyboard = BUTTON_REPLIES[query.data]
+        
+        # Telegram rejects edits that change nothing, so skip the API call.
+        # Compare the plain text: text_html re-escapes ' and & so never matches ours.
+        message = query.message
+        if isinstance(message, Message) and message.text == plain and message.reply_markup == keyboard:
+            return
+        
+        try:
+            await query.edit_message_text(
+                text,
+                parse_mode=ParseMode.HTML,
+                reply_markup=keyboard
+            )
+        except BadRequest as e:
+            if "not modified" not in str(e).lower():
+                logger.warning(f"⚠️ Failed to update menu message: {e}")
+
+# === CHAT HANDLER ===
+# Messages that arrived while a reply for the same user was being generated.
+# Only fills up when the application handles updates concurrently (see main.py).
+pending_messages = {}
+
+async def chat(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle user messages and generate AI responses"""
+    if not update.message or not update.message.text or not update.message.from_user:
+        return
+    
+    user_id = update.message.from_user.id
+    
+    # A reply is already in progress, so queue this message and let the next
+    # request answer everything the user sent meanwhile in one go
+    if user_id in pending_messages:
+        pending_messages[user_id].append(update)
+        return
+    
+    pending_messages[user_id] = [update]
+    try:
+        while pending_messages[user_id]:
+            updates = pending_messages[user_id]
+            pending_messages[user_id] = []
+            await reply_to_messages(user_id, updates, context)
+    finally:
+        del pending_messages[user_id]
+
+async def reply_to_messages(user_id, updates, context):
+    """Generate one AI response to a user's queued messages"""
+    # Answer the most recent message
+    update = updates[-1]
+    
+    try:
+        # Add user messages
+        for queued in updates:
+            await add_to_history(user_id, {"role": "user", "content": queued.message.text})
+        history = await get_history(user_id)
+        
+        # Only include the parts of the knowledge base relevant to recent questions
+        recent_questions = [m["content"] for m in history if m["role"] == "user"][-3:]
+        relevant = await retrieve_knowledge("\n".join(recent_questions))
+        if relevant:
+            system_prompt = build_system_prompt(relevant)
+        else:
+            system_prompt = knowledge_base.system_prompt_cache or BASE_SYSTEM_PROMPT
+        
+        # Generate response
+        messages = [{"role": "system", "content": system_prompt}, *history]
+        
+        completion = await client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=messages,
+            timeout=30
+        )
+        
+        reply = completion.choices[0].message.content
+        
+        if not reply:
+            reply = "I'm not sure how to respond. Could you rephrase your question?"
+        
+        # Add to history
+        await add_to_history(user_id, {"role": "assistant", "content": reply})
+        
+        # Send response
+        await send_formatted_message(update, context, reply, BACK_KEYBOARD)
+        
+    except Exception:
+        logger.exception("❌ Error in chat handler")
+        await send_html_message(update, ERROR_TEXT, BACK_KEYBOARD)
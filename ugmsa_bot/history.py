@@ -0,0 +1,53 @@
+"""Per-user conversation history"""
+from collections import deque, OrderedDict
+import orjson
+from redis import asyncio as aioredis
+
+from .config import REDIS_URL, HISTORY_LIMIT, MAX_CONVERSATIONS
+
+# === INITIALIZE ===
+# History is kept in Redis when REDIS_URL is set, otherwise in process memory
+redis_client = aioredis.from_url(REDIS_URL) if REDIS_URL else None
+user_conversations = OrderedDict()  # Least recently active user first
+
+# === CONVERSATION HISTORY ===
+def history_key(user_id):
+    """Redis key holding a user's conversation"""
+    return f"conv:{user_id}"
+
+async def get_history(user_id):
+    """Return a user's recent messages, oldest first"""
+    if redis_client:
+        return [orjson.loads(item) for item in await redis_client.lrange(history_key(user_id), 0, -1)]
+    if user_id not in user_conversations:
+        return []
+    user_conversations.move_to_end(user_id)
+    return list(user_conversations[user_id])
+
+async def add_to_history(user_id, message):
+    """Append a message, keeping only the last HISTORY_LIMIT"""
+    if redis_client:
+        key = history_key(user_id)
+        async with redis_client.pipeline(transaction=True) as pipe:
+            await pipe.rpush(key, orjson.dumps(message)).ltrim(key, -HISTORY_LIMIT, -1).execute()
+        return
+
+    if user_id in user_conversations:
+        user_conversations.move_to_end(user_id)
+    else:
+        user_conversations[user_id] = deque(maxlen=HISTORY_LIMIT)
+        if len(user_conversations) > MAX_CONVERSATIONS:
+            user_conversations.popitem(last=False)
+    user_conversations[user_id].append(message)
+
+async def clear_history(user_id):
+    """Forget a user's conversation"""
+    if redis_client:
+        await redis_client.delete(history_key(user_id))
+    else:
+        user_conversations.pop(user_id, None)
+
+async def close_history():
+    """Close the Redis connection if one is in use"""
+    if redis_client:
+        await redis_client.aclose()
@@ -0,0 +1,26 @@
+"""Shared network clients (OpenAI and the knowledge base HTTP session)"""
+import aiohttp
+from openai import AsyncOpenAI
+
+from .config import OPENAI_API_KEY
+
+# === INITIALIZE ===
+client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+http_session = None
+
+# === HTTP CLIENT ===
+HTTP_HEADERS = {'User-Agent': 'Mozilla/5.0 (compatible; UGMSABot/1.0)'}
+
+def get_http_session():
+    """Return the shared keep-alive HTTP session, creating it on first use"""
+    global http_session
+    if http_session is None or http_session.closed:
+        http_session = aiohttp.ClientSession(
+            headers=HTTP_HEADERS, timeout=aiohttp.ClientTimeout(total=10)
+        )
+    return http_session
+
+async def close_http_session():
+    """Close the shared HTTP session if one was opened"""
+    if http_session:
+        await http_session.close()
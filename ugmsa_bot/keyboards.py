@@ -0,0 +1,18 @@
+"""Inline keyboards"""
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+from .config import MAIN_BOT_LINK
+
+# === KEYBOARDS ===
+# Markups are immutable, so each keyboard is built once and shared
+MAIN_MENU_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("🎓 UGMSA/FGMSA Info", callback_data="ugmsa_info")],
+    [InlineKeyboardButton("💬 Ask Question", callback_data="ask_question")],
+    [InlineKeyboardButton("🔄 Clear History", callback_data="clear_history")],
+    [InlineKeyboardButton("🏠 Return to Main Bot", url=MAIN_BOT_LINK)]
+])
+
+BACK_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("⬅️ Back to Menu", callback_data="back_to_menu")],
+    [InlineKeyboardButton("🏠 Return to Main Bot", url=MAIN_BOT_LINK)]
+])
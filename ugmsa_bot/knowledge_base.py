@@ -0,0 +1,361 @@
+"""Knowledge base loading, caching and retrieval"""
+import gzip
+import json
+import time
+import hashlib
+import asyncio
+import logging
+import numpy as np
+from selectolax.lexbor import LexborHTMLParser
+
+from .config import (
+    VALID_DOC_IDS, UGMSA_WEBSITE_URL, KB_CACHE_FILE, KB_VALIDATORS_FILE, KB_CACHE_TTL,
+    KB_RETRY_INTERVAL, KB_INDEX_FILE, EMBEDDING_MODEL, KB_CHUNK_CHARS, KB_TOP_K
+)
+from .http_client import client, get_http_session
+
+logger = logging.getLogger(__name__)
+
+# === INITIALIZE ===
+knowledge_base_cache = None
+system_prompt_cache = None
+knowledge_chunks = []
+knowledge_embeddings = None
+knowledge_base_lock = asyncio.Lock()
+
+# === SYSTEM PROMPT ===
+SYSTEM_PROMPT_INTRO = (
+    "You are a friendly and knowledgeable AI assistant for UGMSA "
+    "(University of Ghana Medical Students' Association) students. "
+    "Provide clear, accurate, and helpful responses.\n\n"
+)
+
+FORMATTING_GUIDELINES = (
+    "FORMATTING GUIDELINES:\n"
+    "- Structure responses with clear sections\n"
+    "- Use **bold** for headings and key terms\n"
+    "- Use *italic* for emphasis and notes\n"
+    "- Use bullet points (- ) for lists and multiple items\n"
+    "- Use `code format` for dates, times, locations, and numbers\n"
+    "- Add relevant emojis (🎓📚💡✨) to make content engaging\n"
+    "- Keep paragraphs short (2-3 sentences max)\n"
+    "- Use line breaks to improve readability\n"
+    "- End with actionable next steps when relevant\n"
+    "- Be warm, friendly, and encouraging in tone"
+)
+
+# Used until a knowledge base has been loaded
+BASE_SYSTEM_PROMPT = SYSTEM_PROMPT_INTRO + FORMATTING_GUIDELINES
+
+# Fixed text either side of the knowledge, joined once here rather than per message
+KNOWLEDGE_PROMPT_PREFIX = (
+    SYSTEM_PROMPT_INTRO
+    + "Use this official information to answer questions:\n\n"
+)
+
+KNOWLEDGE_PROMPT_SUFFIX = (
+    "\n\n"
+    "IMPORTANT: Answer questions directly using the information provided. "
+    "Never tell users to 'check the document' or 'visit the website' - "
+    "give them the answer directly.\n\n"
+    + FORMATTING_GUIDELINES
+)
+
+def build_system_prompt(knowledge):
+    """Build the full system prompt around the knowledge base"""
+    return f"{KNOWLEDGE_PROMPT_PREFIX}{knowledge}{KNOWLEDGE_PROMPT_SUFFIX}"
+
+# === KNOWLEDGE BASE LOADING ===
+async def set_knowledge_base(knowledge):
+    """Cache the knowledge base, its system prompt and its retrieval index"""
+    global knowledge_base_cache, system_prompt_cache
+    # An unchanged knowledge base still retries an index build that failed
+    if knowledge == knowledge_base_cache and not knowledge_index_missing():
+        return knowledge
+
+    knowledge_base_cache = knowledge
+    system_prompt_cache = build_system_prompt(knowledge)
+    await build_knowledge_index(knowledge)
+    return knowledge
+
+def read_knowledge_cache(max_age=KB_CACHE_TTL):
+    """Read the cached knowledge base from disk if it is fresh enough"""
+    try:
+        age = time.time() - KB_CACHE_FILE.stat().st_mtime
+        if max_age is None or age < max_age:
+            with gzip.open(KB_CACHE_FILE, 'rt', encoding='utf-8') as f:
+                return f.read() or None
+    except FileNotFoundError:
+        pass
+    except (OSError, EOFError) as e:
+        logger.warning(f"⚠️ Error reading knowledge base cache: {e}")
+    return None
+
+def read_validators():
+    """Read the ETag/Last-Modified validators saved with the last fetch"""
+    try:
+        with gzip.open(KB_VALIDATORS_FILE, 'rt', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, EOFError, ValueError):
+        return {}
+
+def write_knowledge_cache(knowledge, validators):
+    """Persist the knowledge base and its validators to disk"""
+    try:
+        with gzip.open(KB_CACHE_FILE, 'wt', encoding='utf-8') as f:
+            f.write(knowledge)
+        with gzip.open(KB_VALIDATORS_FILE, 'wt', encoding='utf-8') as f:
+            json.dump(validators, f)
+    except OSError as e:
+        logger.warning(f"⚠️ Error writing knowledge base cache: {e}")
+
+def conditional_headers(cached):
+    """Build If-None-Match/If-Modified-Since headers for a cached source"""
+    headers = {}
+    if cached and cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached and cached.get('last_modified'):
+        headers['If-Modified-Since'] = cached['last_modified']
+    return headers
+
+def remember_validators(validators, url, response, content, sha256=None):
+    """Store a source's validators alongside its processed content"""
+    validators[url] = {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'sha256': sha256,
+        'content': content,
+    }
+
+async def fetch_google_doc(session, doc_id, validators):
+    """Fetch content from Google Doc"""
+    url = f"https://docs.google.com/document/d/{doc_id}/export?format=txt"
+    cached = validators.get(url)
+    try:
+        async with session.get(url, headers=conditional_headers(cached)) as response:
+            if response.status == 304 and cached:
+                logger.info("✅ Google Doc not modified, using cached copy")
+                return cached['content']
+            if response.status == 200:
+                # Docs exports rarely carry validators, so hash the body while streaming it
+                digest = hashlib.sha256()
+                chunks = []
+                async for chunk in response.content.iter_chunked(65536):
+                    digest.update(chunk)
+                    chunks.append(chunk)
+                sha256 = digest.hexdigest()
+                if cached and cached.get('sha256') == sha256:
+                    remember_validators(validators, url, response, cached['content'], sha256)
+                    logger.info("✅ Google Doc unchanged, using cached copy")
+                    return cached['content']
+
+                # get_encoding() can't sniff a streamed body, so fall back to UTF-8
+                text = b''.join(chunks).decode(response.charset or 'utf-8')
+                remember_validators(validators, url, response, text, sha256)
+                logger.info(f"✅ Loaded Google Doc ({len(text)} chars)")
+                return text
+    except Exception as e:
+        logger.warning(f"⚠️ Error fetching doc {doc_id}: {e}")
+
+    # Keep the last good copy rather than dropping the source from the knowledge base
+    return cached['content'] if cached else None
+
+def extract_website_text(html):
+    """Strip markup and boilerplate from a web page, keeping readable text"""
+    tree = LexborHTMLParser(html)
+
+    # Remove script and style elements
+    tree.strip_tags(["script", "style", "nav", "footer"])
+
+    # Get text content
+    text = tree.root.text(separator='\n', strip=True) if tree.root else ''
+    # Clean up extra whitespace
+    return '\n'.join(line.strip() for line in text.splitlines() if line.strip())
+
+async def fetch_website_content(session, url, validators):
+    """Fetch and parse website content"""
+    cached = validators.get(url)
+    try:
+        async with session.get(url, headers=conditional_headers(cached)) as response:
+            if response.status == 304 and cached:
+                logger.info("✅ Website not modified, using cached copy")
+                return cached['content']
+            if response.status == 200:
+                html = await response.text()
+                # Parsing is CPU-bound, keep it off the event loop
+                text = await asyncio.to_thread(extract_website_text, html)
+                remember_validators(validators, url, response, text)
+                logger.info(f"✅ Loaded website content ({len(text)} chars)")
+                return text
+    except Exception as e:
+        logger.warning(f"⚠️ Error fetching website: {e}")
+
+    # Keep the last good copy rather than dropping the source from the knowledge base
+    return cached['content'] if cached else None
+
+async def load_knowledge_base():
+    """Return the knowledge base, loading it on first use"""
+    if knowledge_base_cache:
+        return knowledge_base_cache
+
+    # Only one caller loads; concurrent first messages wait for its result
+    async with knowledge_base_lock:
+        if knowledge_base_cache:
+            return knowledge_base_cache
+        return await fetch_knowledge_base()
+
+async def refresh_knowledge_base_periodically():
+    """Reload the knowledge base in the background so chats never have to"""
+    while True:
+        # Retry sooner while nothing (or no retrieval index) has been loaded yet
+        ready = knowledge_base_cache and not knowledge_index_missing()
+        await asyncio.sleep(KB_CACHE_TTL if ready else KB_RETRY_INTERVAL)
+        try:
+            async with knowledge_base_lock:
+                await fetch_knowledge_base()
+        except Exception as e:
+            logger.warning(f"⚠️ Error refreshing knowledge base: {e}")
+
+async def fetch_knowledge_base():
+    """Load all knowledge sources (documents + website) concurrently"""
+    # Reuse the on-disk copy while it is still fresh
+    cached = await asyncio.to_thread(read_knowledge_cache)
+    if cached:
+        logger.info(f"✅ Knowledge base loaded from disk cache ({len(cached)} total chars)")
+        return await set_knowledge_base(cached)
+
+    logger.info("📚 Loading UGMSA knowledge base...")
+    session = get_http_session()
+    validators = await asyncio.to_thread(read_validators)
+
+    # Fetch all Google Docs and the website at the same time
+    *doc_results, website_content = await asyncio.gather(
+        *[fetch_google_doc(session, doc_id, validators) for doc_id in VALID_DOC_IDS],
+        fetch_website_content(session, UGMSA_WEBSITE_URL, validators),
+        return_exceptions=True
+    )
+
+    sources = []
+    for content in doc_results:
+        if isinstance(content, str) and content:
+            sources.append(f"=== OFFICIAL DOCUMENT ===\n{content}")
+
+    if isinstance(website_content, str) and website_content:
+        sources.append(f"=== UGMSA WEBSITE (ugmsa.org) ===\n{website_content}")
+
+    if sources:
+        knowledge = "\n\n".join(sources)
+        await asyncio.to_thread(write_knowledge_cache, knowledge, validators)
+        logger.info(f"✅ Knowledge base ready ({len(knowledge)} total chars)")
+        return await set_knowledge_base(knowledge)
+
+    # Upstream is unavailable, so a stale copy is better than nothing
+    stale = await asyncio.to_thread(read_knowledge_cache, max_age=None)
+    if stale:
+        logger.warning("⚠️ Knowledge sources unavailable, using stale disk cache")
+        return await set_knowledge_base(stale)
+
+    logger.warning("⚠️ No knowledge sources loaded")
+    return None
+
+# === KNOWLEDGE RETRIEVAL ===
+def split_knowledge_base(knowledge, max_chars=KB_CHUNK_CHARS):
+    """Split the knowledge base into chunks of whole lines up to max_chars"""
+    chunks = []
+    current = []
+    size = 0
+    for line in knowledge.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        # Over-long lines are cut so no chunk exceeds the limit
+        while len(line) > max_chars:
+            chunks.append(line[:max_chars])
+            line = line[max_chars:]
+        if current and size + len(line) + 1 > max_chars:
+            chunks.append('\n'.join(current))
+            current, size = [], 0
+        current.append(line)
+        size += len(line) + 1
+    if current:
+        chunks.append('\n'.join(current))
+    return chunks
+
+def read_knowledge_index(digest):
+    """Read saved chunk embeddings if they were built from the same knowledge base"""
+    try:
+        with np.load(KB_INDEX_FILE) as data:
+            if str(data['digest']) == digest:
+                return data['chunks'].tolist(), data['matrix']
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"⚠️ Error reading knowledge index: {e}")
+    return None
+
+def write_knowledge_index(digest, chunks, matrix):
+    """Save chunk embeddings so restarts don't have to embed again"""
+    try:
+        np.savez_compressed(KB_INDEX_FILE, digest=digest, chunks=np.array(chunks), matrix=matrix)
+    except OSError as e:
+        logger.warning(f"⚠️ Error writing knowledge index: {e}")
+
+def knowledge_index_missing():
+    """Whether the knowledge base is big enough for retrieval but has no index"""
+    return knowledge_embeddings is None and len(knowledge_chunks) > KB_TOP_K
+
+async def build_knowledge_index(knowledge):
+    """Embed the knowledge base chunks once so questions can be matched against them"""
+    global knowledge_chunks, knowledge_embeddings
+    # Chunks and embeddings are only ever replaced together, so a question being
+    # answered meanwhile keeps using the previous index rather than half of each
+    chunks = split_knowledge_base(knowledge)
+
+    # Small knowledge bases are sent whole, retrieval would not save anything
+    if len(chunks) <= KB_TOP_K:
+        knowledge_chunks, knowledge_embeddings = chunks, None
+        return
+
+    digest = hashlib.sha256(knowledge.encode('utf-8')).hexdigest()
+    saved = await asyncio.to_thread(read_knowledge_index, digest)
+    if saved:
+        knowledge_chunks, knowledge_embeddings = saved
+        logger.info(f"✅ Knowledge index loaded from disk ({len(knowledge_chunks)} chunks)")
+        return
+
+    try:
+        response = await client.embeddings.create(model=EMBEDDING_MODEL, input=chunks)
+        matrix = np.array([item.embedding for item in response.data], dtype=np.float32)
+        # Normalise rows so a dot product gives the cosine similarity, then
+        # store at half precision (ranking is unaffected, memory is halved)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = matrix.astype(np.float16)
+    except Exception as e:
+        logger.warning(f"⚠️ Error building knowledge index, sending full knowledge base: {e}")
+        # Don't answer from an index of outdated chunks
+        knowledge_chunks, knowledge_embeddings = chunks, None
+        return
+
+    knowledge_chunks, knowledge_embeddings = chunks, matrix
+    logger.info(f"✅ Knowledge index ready ({len(chunks)} chunks)")
+    await asyncio.to_thread(write_knowledge_index, digest, chunks, matrix)
+
+async def retrieve_knowledge(query, top_k=KB_TOP_K):
+    """Return the knowledge base chunks most relevant to a question"""
+    # Take the index as it is now, a refresh may replace it while we await
+    chunks, matrix = knowledge_chunks, knowledge_embeddings
+    if matrix is None:
+        return None
+
+    try:
+        response = await client.embeddings.create(model=EMBEDDING_MODEL, input=[query])
+    except Exception as e:
+        logger.warning(f"⚠️ Error embedding question, sending full knowledge base: {e}")
+        return None
+
+    # The float16 matrix is promoted to float32 for the dot product
+    query_embedding = np.asarray(response.data[0].embedding, dtype=np.float32)
+    scores = matrix @ query_embedding
+    top = np.argpartition(-scores, top_k - 1)[:top_k]
+    top = top[np.argsort(-scores[top])]
+    return "\n\n".join(chunks[i] for i in top)
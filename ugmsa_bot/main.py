@@ -0,0 +1,138 @@
+"""Bot entry point: health check server, startup and graceful shutdown"""
+import sys
+import signal
+import asyncio
+import logging
+from threading import Thread
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from telegram import Update
+from telegram.ext import ApplicationBuilder, CommandHandler, MessageHandler, filters, CallbackQueryHandler
+
+from .config import TELEGRAM_TOKEN, PORT
+from .handlers import start, menu, button_callback, chat
+from .history import close_history
+from .http_client import close_http_session
+from .knowledge_base import load_knowledge_base, refresh_knowledge_base_periodically
+
+logger = logging.getLogger(__name__)
+
+# === INITIALIZE ===
+health_server = None
+bot_running = True
+
+# === HEALTH CHECK SERVER ===
+class HealthCheckHandler(BaseHTTPRequestHandler):
+    """Simple HTTP server for health checks"""
+
+    def do_GET(self):
+        """Handle GET requests"""
+        if self.path in ['/', '/health', '/healthz']:
+            self.send_response(200)
+            self.send_header('Content-type', 'text/plain')
+            self.end_headers()
+            self.wfile.write(b'OK')
+        else:
+            self.send_response(404)
+            self.end_headers()
+
+    def log_message(self, format, *args):
+        """Suppress health check logs"""
+        pass
+
+def start_health_server():
+    """Start health check server in background thread"""
+    global health_server
+    try:
+        health_server = HTTPServer(('0.0.0.0', PORT), HealthCheckHandler)
+        logger.info(f"Health check server started on port {PORT}")
+        health_server.serve_forever()
+    except Exception as e:
+        logger.error(f"Failed to start health check server: {e}")
+
+# === MAIN ===
+# Global variable to hold the application
+app = None
+
+def signal_handler(sig, _frame):
+    """Handle shutdown signals gracefully"""
+    global bot_running, health_server
+    logger.info(f"🛑 Received signal {sig}, shutting down gracefully...")
+    bot_running = False
+
+    if health_server:
+        try:
+            health_server.shutdown()
+        except Exception:
+            pass
+
+async def main():
+    """Run the bot safely inside Render background worker"""
+    global app, bot_running
+
+    try:
+        # Start health check server in background
+        health_thread = Thread(target=start_health_server, daemon=True)
+        health_thread.start()
+        logger.info("🏥 Health check endpoint ready")
+
+        # Load knowledge base once, then keep it fresh in the background
+        await load_knowledge_base()
+        refresh_task = asyncio.create_task(refresh_knowledge_base_periodically())
+
+        # Build application (updates are handled concurrently so a slow reply doesn't block others)
+        app = ApplicationBuilder().token(TELEGRAM_TOKEN).concurrent_updates(True).build()
+
+        # Register handlers
+        app.add_handler(CommandHandler("start", start))
+        app.add_handler(CommandHandler("menu", menu))
+        app.add_handler(CallbackQueryHandler(button_callback))
+        app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, chat))
+
+        logger.info("🤖 UGMSA AI Bot is starting...")
+
+        # Initialize and start bot
+        await app.initialize()
+        await app.start()
+        await app.updater.start_polling(
+            allowed_updates=Update.ALL_TYPES,
+            drop_pending_updates=True
+        )
+
+        logger.info("✅ Bot is now running and accepting messages!")
+
+        # Keep running until shutdown signal
+        while bot_running:
+            await asyncio.sleep(1)
+
+        # Graceful shutdown
+        logger.info("🔄 Stopping bot gracefully...")
+        refresh_task.cancel()
+        await app.updater.stop()
+        await app.stop()
+        await app.shutdown()
+        await close_http_session()
+        await close_history()
+        logger.info("✅ Bot stopped successfully")
+
+    except Exception as e:
+        logger.error(f"❌ Fatal error in main: {e}", exc_info=True)
+        raise
+
+def run():
+    """Start the bot and block until it is shut down"""
+    # Register signal handlers for graceful shutdown
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+
+    try:
+        logger.info("🚀 Starting UGMSA AI Bot...")
+        asyncio.run(main())
+    except (KeyboardInterrupt, SystemExit):
+        logger.info("🛑 Bot stopped by user")
+    except Exception as e:
+        logger.error(f"❌ Unexpected error: {e}", exc_info=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,72 @@
+"""Static bot messages"""
+import re
+import html
+from .keyboards import MAIN_MENU_KEYBOARD, BACK_KEYBOARD
+
+# === STATIC MESSAGES ===
+WELCOME_TEXT = (
+    "👋 <b>Welcome to UGMSA AI Assistant!</b>\n\n"
+    "🎓 Your personal guide to the University of Ghana Medical Students' Association\n\n"
+    "<b>How I Can Help:</b>\n"
+    "  ✓ UGMSA/FGMSA information & programs\n"
+    "  ✓ Events, meetings & important dates\n"
+    "  ✓ Membership & resources\n"
+    "  ✓ Academic support & advice\n\n"
+    "💡 <i>Choose an option below to get started</i>"
+)
+
+MENU_TEXT = (
+    "📋 <b>Main Menu</b>\n\n"
+    "What would you like to explore today?"
+)
+
+UGMSA_INFO_TEXT = (
+    "📚 <b>UGMSA/FGMSA Knowledge Base</b>\n\n"
+    "Ask me anything about the University of Ghana Medical Students' Association!\n\n"
+    "<b>📖 My Knowledge Sources:</b>\n"
+    "  ✓ Official UGMSA documents\n"
+    "  ✓ Live website data (ugmsa.org)\n"
+    "  ✓ Programs, events & activities\n"
+    "  ✓ Membership guidelines\n"
+    "  ✓ Leadership & contact info\n\n"
+    "💬 <i>Type your question below and I'll provide detailed answers</i>"
+)
+
+ASK_QUESTION_TEXT = (
+    "💬 <b>Ask Me Anything!</b>\n\n"
+    "I'm here to help with:\n\n"
+    "<b>🎓 UGMSA Topics:</b>\n"
+    "  ✓ Events & programs\n"
+    "  ✓ Membership information\n"
+    "  ✓ Leadership structure\n"
+    "  ✓ Resources & opportunities\n\n"
+    "<b>📚 Academic Support:</b>\n"
+    "  ✓ Study tips & guidance\n"
+    "  ✓ Course information\n"
+    "  ✓ Student life advice\n\n"
+    "🎯 <i>Just type your question below!</i>"
+)
+
+HISTORY_CLEARED_TEXT = (
+    "✅ <b>Chat History Cleared!</b>\n\n"
+    "🔄 Your conversation has been reset.\n\n"
+    "Ready for a fresh start? Ask me anything!"
+)
+
+ERROR_TEXT = (
+    "⚠️ <b>Oops! Something went wrong</b>\n\n"
+    "I encountered a temporary issue processing your request.\n\n"
+    "💡 <i>Please try again, or rephrase your question</i>"
+)
+
+def plain_text(html_text):
+    """The text Telegram shows for an HTML message (what Message.text holds)"""
+    return html.unescape(re.sub(r'<[^>]+>', '', html_text))
+
+# Button data -> (HTML, plain text, keyboard)
+BUTTON_REPLIES = {
+    "back_to_menu": (MENU_TEXT, plain_text(MENU_TEXT), MAIN_MENU_KEYBOARD),
+    "ugmsa_info": (UGMSA_INFO_TEXT, plain_text(UGMSA_INFO_TEXT), BACK_KEYBOARD),
+    "ask_question": (ASK_QUESTION_TEXT, plain_text(ASK_QUESTION_TEXT), BACK_KEYBOARD),
+    "clear_history": (HISTORY_CLEARED_TEXT, plain_text(HISTORY_CLEARED_TEXT), BACK_KEYBOARD),
+}